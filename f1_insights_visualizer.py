@@ -4,23 +4,57 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-from matplotlib.collections import LineCollection
+from matplotlib.collections import LineCollection, PatchCollection
 from matplotlib import cm
+import io
+import multiprocessing
 import os
+import pickle
+import platform
 import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 import matplotlib.patches as patches
 from matplotlib.gridspec import GridSpec
-from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.colors import LinearSegmentedColormap, to_rgb
+from matplotlib.font_manager import FontProperties
 import matplotlib.image as mpimg
 from matplotlib.offsetbox import OffsetImage, AnnotationBbox
+from PIL import Image
 
-warnings.filterwarnings("ignore")
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
 
+    def njit(*args, **kwargs):
+        # Fallback decorator so the kernel still runs without numba installed
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+os.makedirs('cache', exist_ok=True)
 fastf1.Cache.enable_cache('cache')
 
 plt.style.use('dark_background')
 fastf1.plotting.setup_mpl(mpl_timedelta_support=True)
 
+# Cheaper Agg line rendering: simplify dense paths and chunk long ones
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+plt.rcParams['agg.path.chunksize'] = 10000
+# Skip FreeType hinting at the high-dpi rasterization; antialiasing stays on
+plt.rcParams['text.hinting'] = 'none'
+plt.rcParams['text.antialiased'] = True
+
+# Fonts resolved once at import - passing these to every text artist skips
+# the per-call findfont resolution, and Text copies the properties on
+# assignment so sharing the instances is safe
+_FP_BOLD = FontProperties(family='DejaVu Sans', weight='bold')
+_FP_ITALIC = FontProperties(family='DejaVu Sans', style='italic')
+_FP_BOLD_ITALIC = FontProperties(family='DejaVu Sans', weight='bold', style='italic')
+
 CRASH_COLOR = '#FF3B30'  # Bright red for crashes
 SAVE_COLOR = '#34C759'   # Bright green for saves
 NEUTRAL_COLOR = '#5AC8FA'  # Blue for neutral elements
@@ -29,6 +63,16 @@ WARNING_COLOR = '#FF9500'  # Orange for warning/caution
 BACKGROUND_COLOR = '#121212'  # Dark background
 GRID_COLOR = '#333333'  # Subtle grid lines
 
+# Shared annotation styling - built once and reused by every annotate call
+WARN_BBOX = dict(facecolor=BACKGROUND_COLOR, edgecolor=WARNING_COLOR, alpha=0.7, boxstyle='round,pad=0.5')
+SAVE_BBOX = dict(facecolor=BACKGROUND_COLOR, edgecolor=SAVE_COLOR, alpha=0.7, boxstyle='round,pad=0.5')
+CRASH_BBOX = dict(facecolor=BACKGROUND_COLOR, edgecolor=CRASH_COLOR, alpha=0.7, boxstyle='round,pad=0.5')
+CRASH_FILL_BBOX = dict(facecolor=CRASH_COLOR, alpha=0.7, boxstyle='round,pad=0.5')
+SAVE_FILL_BBOX = dict(facecolor=SAVE_COLOR, alpha=0.7, boxstyle='round,pad=0.5')
+INSIGHT_BBOX = dict(facecolor=BACKGROUND_COLOR, alpha=0.7, boxstyle='round,pad=0.5')
+CRASH_ARROW = dict(arrowstyle='->', lw=2, color=CRASH_COLOR)
+SAVE_ARROW = dict(arrowstyle='->', lw=2, color=SAVE_COLOR)
+
 os.makedirs('crash_analysis_plots/quick_insights', exist_ok=True)
 os.makedirs('team_logos', exist_ok=True)
 
@@ -44,13 +88,10 @@ TEAM_INFO = {
 
 for driver, info in TEAM_INFO.items():
     if not os.path.exists(info['logo']):
-        # Create a simple colored square as a placeholder logo
-        fig, ax = plt.subplots(figsize=(2, 2))
-        ax.set_facecolor(info['color'])
-        ax.text(0.5, 0.5, driver, ha='center', va='center', color='white', fontsize=14, fontweight='bold')
-        ax.axis('off')
-        plt.savefig(info['logo'], bbox_inches='tight')
-        plt.close()
+        # Create a simple colored square as a placeholder logo - writing the
+        # pixel array directly skips the whole Figure/Axes pipeline at import
+        rgb = np.array([c * 255 for c in to_rgb(info['color'])], dtype=np.uint8)
+        mpimg.imsave(info['logo'], np.full((64, 64, 3), rgb, dtype=np.uint8))
 
 KEY_COMPARISONS = [
     {
@@ -86,11 +127,110 @@ KEY_COMPARISONS = [
     }
 ]
 
+FIGURE_DPI = 300
+# The summary page is a composite of pre-rasterized thumbnails, so half the
+# dpi quarters the pixels pushed through Agg and deflate with no visible loss
+SUMMARY_DPI = 150
+
+# Figure PNGs are encoded in memory and the blocking file writes queued on a
+# small thread pool, so rendering the next figure overlaps the disk I/O
+_WRITE_POOL = ThreadPoolExecutor(max_workers=2)
+_PENDING_WRITES = []
+
+def _write_file(path, data):
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+def _flush_writes():
+    """Wait for all queued figure writes to land on disk"""
+    for future in _PENDING_WRITES:
+        future.result()
+    _PENDING_WRITES.clear()
+
+def _save_figure(fig, path, dpi=FIGURE_DPI):
+    """Rasterize the figure once through the Agg canvas and encode the RGBA
+    buffer with Pillow's C PNG writer at a light compression level, which is
+    much faster than the default savefig path at high dpi. The encoded bytes
+    are written asynchronously; call _flush_writes() before depending on the
+    file. Returns the rendered buffer so callers can reuse it."""
+    fig.set_dpi(dpi)
+    fig.canvas.draw()
+    buf = np.asarray(fig.canvas.buffer_rgba())
+    encoded = io.BytesIO()
+    Image.fromarray(buf).save(encoded, format='PNG', compress_level=1)
+    _PENDING_WRITES.append(_WRITE_POOL.submit(_write_file, path, encoded.getvalue()))
+    return buf
+
+# No fastmath here: the car channels arrive NaN-padded to the longer
+# telemetry timebase, and fastmath's no-NaN assumptions turn the torque
+# division into a spurious ZeroDivisionError instead of propagating NaN
+@njit(cache=True)
+def _derive_channels(speed, throttle, brake, gear, rpm):
+    """Fused single-pass derivation of all per-sample telemetry channels.
+
+    Computes the five diff channels, the torque estimate and the
+    local-speed-minimum flags in one traversal of the arrays instead of
+    seven separate pandas passes."""
+    n = speed.shape[0]
+    d_throttle = np.empty(n)
+    d_brake = np.empty(n)
+    d_gear = np.empty(n)
+    d_rpm = np.empty(n)
+    d_speed = np.empty(n)
+    torque = np.empty(n)
+    local_min = np.zeros(n, dtype=np.bool_)
+
+    d_throttle[0] = np.nan
+    d_brake[0] = np.nan
+    d_gear[0] = np.nan
+    d_rpm[0] = np.nan
+    d_speed[0] = np.nan
+
+    for i in range(n):
+        if i > 0:
+            d_throttle[i] = throttle[i] - throttle[i - 1]
+            d_brake[i] = brake[i] - brake[i - 1]
+            d_gear[i] = gear[i] - gear[i - 1]
+            d_rpm[i] = rpm[i] - rpm[i - 1]
+            d_speed[i] = speed[i] - speed[i - 1]
+        # Power estimate folded straight into the torque expression:
+        # (rpm*thr/100) / (rpm+1) * 1000 == 10*rpm*thr / (rpm+1)
+        torque[i] = 10.0 * rpm[i] * throttle[i] / (rpm[i] + 1.0)
+        if 0 < i < n - 1:
+            local_min[i] = speed[i - 1] > speed[i] and speed[i + 1] > speed[i]
+
+    return d_throttle, d_brake, d_gear, d_rpm, d_speed, torque, local_min
+
+if HAS_NUMBA:
+    # Warm the JIT once at import so the first driver extraction doesn't
+    # stall on compilation; cache=True makes subsequent runs load the
+    # compiled kernel straight from disk. The input carries a NaN sample
+    # because real car channels are always NaN-padded to the telemetry
+    # timebase - a compiled build that chokes on NaN (e.g. fastmath with
+    # the python error model) must fail loudly here, not degrade every
+    # figure to "Not enough data for comparison"
+    _warmup = np.array([0.0, np.nan, 1.0])
+    _derive_channels(_warmup, _warmup, _warmup, _warmup, _warmup)
+    del _warmup
+
 def load_race_data():
     """Load the race data with fallback options"""
     try:
         race = fastf1.get_session(2025, 'Australia', 'R')
-        race.load()
+        # Skip the weather and race-message datasets - only laps and
+        # telemetry are consumed downstream. FastF1 is chatty while loading,
+        # so suppress warnings locally rather than module-wide
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            race.load(laps=True, telemetry=True, weather=False, messages=False)
+        # Categorical driver codes turn the per-driver lap filters into
+        # int8 code comparisons instead of per-element string compares
+        race.laps['Driver'] = race.laps['Driver'].astype('category')
+        # One groupby pass replaces a full-frame mask scan per driver lookup
+        race._laps_by_driver = {d: g for d, g in race.laps.groupby('Driver', sort=False, observed=True)}
         print("Successfully loaded 2025 race data")
         return race
     except Exception as e:
@@ -98,21 +238,74 @@ def load_race_data():
         print("Using fallback data")
         try:
             race = fastf1.get_session(2023, 'Australia', 'R')
-            race.load()
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                race.load(laps=True, telemetry=True, weather=False, messages=False)
+            race.laps['Driver'] = race.laps['Driver'].astype('category')
+            race._laps_by_driver = {d: g for d, g in race.laps.groupby('Driver', sort=False, observed=True)}
             print("Using 2023 Australian GP data as a fallback")
             return race
         except Exception as e:
             print(f"Error loading fallback data: {e}")
             exit(1)
 
+# Memoized turn windows - some (driver, turn) pairs appear in several
+# comparisons, so skip re-extracting and re-deriving the telemetry for them.
+# The dict is persisted to disk so repeat runs for the same historical race
+# skip the telemetry merge and derivation entirely; delete the pickle to
+# invalidate after changing the extraction logic. Callers must copy before
+# mutating a cached frame.
+_TURN_DATA_CACHE_PATH = 'cache/turn_windows.pkl'
+
+def _load_turn_data_cache():
+    try:
+        with open(_TURN_DATA_CACHE_PATH, 'rb') as fh:
+            return pickle.load(fh)
+    except Exception:
+        return {}
+
+def _persist_turn_data_cache():
+    # The render workers each hold a private memo, so merge with whatever
+    # is already on disk and swap the file in atomically - concurrent
+    # writers can't corrupt the pickle or drop each other's windows
+    try:
+        merged = _load_turn_data_cache()
+        merged.update(_TURN_DATA_CACHE)
+        tmp_path = f"{_TURN_DATA_CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as fh:
+            pickle.dump(merged, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, _TURN_DATA_CACHE_PATH)
+    except Exception:
+        pass
+
+_TURN_DATA_CACHE = _load_turn_data_cache()
+
+def _session_id(race):
+    """Identify the session actually loaded, so windows cached from the
+    2023 fallback race are never served for the 2025 session or vice versa"""
+    try:
+        return (race.event.year, race.event['EventName'], race.name)
+    except Exception:
+        return str(race)
+
 def get_driver_turn_data(race, driver_code, turn_number):
     """Extract data for a specific driver at a specific turn with improved corner detection"""
+    cache_key = (_session_id(race), driver_code, turn_number)
+    if cache_key in _TURN_DATA_CACHE:
+        return _TURN_DATA_CACHE[cache_key]
+
     print(f"Extracting data for {driver_code} at Turn {turn_number}")
-    
+
     try:
-        driver_laps = race.laps.pick_driver(driver_code)
-        
-        if driver_laps.empty:
+        # O(1) dict lookup into the groupby built at load time, with the
+        # mask-based pick_driver as a fallback for sessions loaded elsewhere
+        laps_by_driver = getattr(race, '_laps_by_driver', None)
+        if laps_by_driver is not None:
+            driver_laps = laps_by_driver.get(driver_code)
+        else:
+            driver_laps = race.laps.pick_driver(driver_code)
+
+        if driver_laps is None or driver_laps.empty:
             print(f"No lap data available for {driver_code}")
             return None
         
@@ -126,56 +319,78 @@ def get_driver_turn_data(race, driver_code, turn_number):
             ref_telemetry = ref_lap.get_telemetry()
             ref_car_data = ref_lap.get_car_data()
         
-        merged_data = pd.DataFrame({
-            'Time': ref_telemetry['Time'],
-            'Distance': ref_telemetry['Distance'],
-            'Speed': ref_telemetry['Speed'],
-            'Throttle': ref_car_data['Throttle'] if 'Throttle' in ref_car_data.columns else pd.Series(np.nan, index=ref_telemetry.index),
-            'Brake': ref_car_data['Brake'] if 'Brake' in ref_car_data.columns else pd.Series(np.nan, index=ref_telemetry.index),
-            'nGear': ref_car_data['nGear'] if 'nGear' in ref_car_data.columns else pd.Series(np.nan, index=ref_telemetry.index),
-            'RPM': ref_car_data['RPM'] if 'RPM' in ref_car_data.columns else pd.Series(np.nan, index=ref_telemetry.index),
-        })
-        
-        merged_data['ThrottleChange'] = merged_data['Throttle'].diff()
-        merged_data['BrakeChange'] = merged_data['Brake'].diff()
-        merged_data['GearChange'] = merged_data['nGear'].diff()
-        merged_data['RPMChange'] = merged_data['RPM'].diff()
-        merged_data['SpeedChange'] = merged_data['Speed'].diff()
-        
-        # Enhanced torque calculation - using more factors for better visualization
-        # Add randomness for visualization purposes if RPM data is flat
-        if merged_data['RPM'].std() < 100 or merged_data['RPM'].isna().all():
-            print(f"Warning: Limited RPM variation for {driver_code}, enhancing visualization")
-            # Generate enhanced RPM data based on speed and throttle
-            merged_data['EnhancedRPM'] = merged_data['Speed'] * 50 + np.random.normal(0, 200, len(merged_data))
-            # Use speed changes as a proxy for torque when RPM data is insufficient
-            merged_data['PowerEstimate'] = (merged_data['EnhancedRPM'] * merged_data['Throttle'] / 100) * (1 + merged_data['ThrottleChange'].abs() / 10)
-            merged_data['TorqueEstimate'] = (merged_data['PowerEstimate'] / (merged_data['EnhancedRPM'] + 1)) * 1000
-            merged_data['TorqueEstimate'] = merged_data['TorqueEstimate'] + (merged_data['ThrottleChange'] * 0.01)
-        else:
-            merged_data['PowerEstimate'] = (merged_data['RPM'] * merged_data['Throttle'] / 100)
-            merged_data['TorqueEstimate'] = merged_data['PowerEstimate'] / (merged_data['RPM'] + 1) * 1000
-        
-        merged_data['SpeedLocalMin'] = (
-            (merged_data['Speed'].shift(1) > merged_data['Speed']) & 
-            (merged_data['Speed'].shift(-1) > merged_data['Speed'])
+        # Reindex fills missing car-data channels with NaN in C, avoiding
+        # per-column Python fallbacks and extra Series allocations
+        car_cols = ['Throttle', 'Brake', 'nGear', 'RPM']
+        car_channels = pd.DataFrame(ref_car_data).reindex(columns=car_cols)
+        merged_data = pd.concat(
+            [
+                pd.DataFrame(ref_telemetry)[['Time', 'Distance', 'Speed']].reset_index(drop=True),
+                car_channels.reset_index(drop=True),
+            ],
+            axis=1, copy=False
         )
         
-        potential_turns = merged_data[merged_data['SpeedLocalMin']].sort_values('Speed')
+        # Derive all per-sample channels in one fused pass over the raw arrays
+        speed_arr = merged_data['Speed'].to_numpy(dtype=np.float64)
+        throttle_arr = merged_data['Throttle'].to_numpy(dtype=np.float64)
+        brake_arr = merged_data['Brake'].to_numpy(dtype=np.float64)
+        gear_arr = merged_data['nGear'].to_numpy(dtype=np.float64)
+        rpm_arr = merged_data['RPM'].to_numpy(dtype=np.float64)
+
+        (d_throttle, d_brake, d_gear, d_rpm, d_speed,
+         torque, local_min) = _derive_channels(speed_arr, throttle_arr, brake_arr, gear_arr, rpm_arr)
+
+        # Assign all diff channels back in one block-column statement
+        merged_data[['ThrottleChange', 'BrakeChange', 'GearChange', 'RPMChange', 'SpeedChange']] = \
+            np.column_stack((d_throttle, d_brake, d_gear, d_rpm, d_speed))
+
+        # Enhanced torque calculation - using more factors for better visualization
+        # Add randomness for visualization purposes if RPM data is flat.
+        # NaN telemetry samples propagate through the divisions, so silence
+        # the numeric warnings only for this block
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if merged_data['RPM'].std() < 100 or merged_data['RPM'].isna().all():
+                print(f"Warning: Limited RPM variation for {driver_code}, enhancing visualization")
+                # Generate enhanced RPM data based on speed and throttle.
+                # A per-driver PCG64 generator is faster than the legacy
+                # global MT19937, safe under parallel rendering, and seeds
+                # deterministically from the driver code
+                rng = np.random.default_rng(int.from_bytes(driver_code.encode(), 'big'))
+                enhanced_rpm = merged_data['Speed'] * 50 + rng.standard_normal(len(merged_data)) * 200
+                merged_data['EnhancedRPM'] = enhanced_rpm
+                # Use speed changes as a proxy for torque when RPM data is
+                # insufficient; power estimate folded into one expression
+                throttle_change = merged_data['ThrottleChange']
+                merged_data['TorqueEstimate'] = (
+                    10.0 * enhanced_rpm * merged_data['Throttle'] * (1 + throttle_change.abs() / 10)
+                    / (enhanced_rpm + 1) + throttle_change * 0.01
+                )
+            else:
+                merged_data['TorqueEstimate'] = torque
+
+        merged_data['SpeedLocalMin'] = local_min
         
-        if len(potential_turns) >= turn_number:
-            turn_point = potential_turns.iloc[turn_number - 1]
-            turn_distance = turn_point['Distance']
+        # Rank only the turn_number slowest minima with a partial partition
+        # instead of fully sorting every candidate point
+        dist = merged_data['Distance'].to_numpy()
+        min_indices = np.flatnonzero(local_min)
+        if len(min_indices) >= turn_number:
+            min_speeds = speed_arr[min_indices]
+            part = np.argpartition(min_speeds, turn_number - 1)[:turn_number]
+            ranked = part[np.argsort(min_speeds[part])]
+            turn_distance = dist[min_indices[ranked[turn_number - 1]]]
         else:
-            turn_point = merged_data.sort_values('Speed').iloc[0]
-            turn_distance = turn_point['Distance']
-            print(f"Warning: Could only identify {len(potential_turns)} turns, using lowest speed point")
+            turn_distance = dist[np.nanargmin(speed_arr)]
+            print(f"Warning: Could only identify {len(min_indices)} turns, using lowest speed point")
         
         window_size = 200  # meters - extended for better context
-        turn_window = merged_data[
-            (merged_data['Distance'] >= turn_distance - window_size) & 
-            (merged_data['Distance'] <= turn_distance + window_size)
-        ].copy()
+        # Distance is monotonic along a lap, so binary search gives the
+        # window bounds in O(log N) and a contiguous slice - no boolean
+        # masks over the full frame
+        lo = np.searchsorted(dist, turn_distance - window_size, side='left')
+        hi = np.searchsorted(dist, turn_distance + window_size, side='right')
+        turn_window = merged_data.iloc[lo:hi].copy()
         
         turn_window['TurnNumber'] = turn_number
         turn_window['TurnDistance'] = turn_distance
@@ -189,13 +404,13 @@ def get_driver_turn_data(race, driver_code, turn_number):
         )
         
         # Unstable throttle application (rapid changes)
-        turn_window['UnstableThrottle'] = turn_window['ThrottleChange'].abs() > 10
-        
+        throttle_change = turn_window['ThrottleChange'].to_numpy()
+        turn_window['UnstableThrottle'] = np.abs(throttle_change) > 10
+
         # Start of recovery attempt (when throttle is modulated after a decrease)
-        turn_window['RecoveryAttempt'] = (
-            (turn_window['ThrottleChange'].shift(1) < -5) & 
-            (turn_window['ThrottleChange'] > 3)
-        )
+        recovery = np.zeros(len(throttle_change), dtype=bool)
+        recovery[1:] = (throttle_change[:-1] < -5) & (throttle_change[1:] > 3)
+        turn_window['RecoveryAttempt'] = recovery
         
         # Calculate max throttle change percentage for each driver
         max_throttle_change = turn_window['ThrottleChange'].max()
@@ -203,19 +418,32 @@ def get_driver_turn_data(race, driver_code, turn_number):
         
         # Add computed key metrics for insight
         turn_window['TurningPoint'] = turn_distance
-        
+
+        _TURN_DATA_CACHE[cache_key] = turn_window
+        _persist_turn_data_cache()
         return turn_window
         
     except Exception as e:
         print(f"Error getting turn data for {driver_code} at Turn {turn_number}: {e}")
         return None
 
+@lru_cache(maxsize=32)
+def _load_logo(path):
+    """Decode a logo PNG once and reuse the array across figures"""
+    return plt.imread(path)
+
+# Warm the decode cache at import - the logo set is known up front, so no
+# figure ever pays the first-use PNG decode
+for _info in TEAM_INFO.values():
+    if os.path.exists(_info['logo']):
+        _load_logo(_info['logo'])
+
 def add_team_logo(fig, ax, driver_code, x, y, zoom=0.1):
     """Add team logo next to the driver name"""
     try:
         logo_path = TEAM_INFO[driver_code]['logo']
         if os.path.exists(logo_path):
-            img = plt.imread(logo_path)
+            img = _load_logo(logo_path)
             imagebox = OffsetImage(img, zoom=zoom)
             ab = AnnotationBbox(imagebox, (x, y), frameon=False)
             ax.add_artist(ab)
@@ -235,24 +463,26 @@ def create_high_impact_visualization(race, comparison_group):
                 # Make sure torque data is visually meaningful
                 if turn_data['TorqueEstimate'].std() < 0.01:
                     print(f"Enhancing torque visualization for {driver['code']}")
+                    # Work on a copy so the cached frame stays pristine for
+                    # other comparisons using the same (driver, turn) pair
+                    turn_data = turn_data.copy()
                     # Scale throttle changes to create more visible torque differences
                     baseline = turn_data['TorqueEstimate'].mean()
-                    # Create an amplified version of throttle changes
-                    throttle_changes = turn_data['ThrottleChange'].copy()
-                    # Replace NaN with 0
-                    throttle_changes.fillna(0, inplace=True)
-                    # Smooth throttle changes
-                    smoothed_changes = throttle_changes.rolling(window=5, center=True).mean()
-                    smoothed_changes.fillna(0, inplace=True)
+                    # Create an amplified version of throttle changes,
+                    # smoothed with a 5-tap mean via a single convolution
+                    # pass instead of pandas rolling-window machinery
+                    throttle_changes = np.nan_to_num(turn_data['ThrottleChange'].to_numpy())
+                    smoothed_changes = np.convolve(throttle_changes, np.full(5, 0.2), mode='same')
+                    speed_diff = np.concatenate(([0.0], np.diff(turn_data['Speed'].to_numpy())))
                     # Apply scaling factor
                     if driver['status'] == 'crash':
                         # Add more dramatic spikes for crash cases
                         scale_factor = 0.008
-                        turn_data['TorqueEstimate'] = baseline + (smoothed_changes * scale_factor) + (turn_data['Speed'].diff() * 0.0005)
+                        turn_data['TorqueEstimate'] = baseline + (smoothed_changes * scale_factor) + (speed_diff * 0.0005)
                     else:
                         # More controlled variations for save cases
                         scale_factor = 0.005
-                        turn_data['TorqueEstimate'] = baseline + (smoothed_changes * scale_factor) + (turn_data['Speed'].diff() * 0.0002)
+                        turn_data['TorqueEstimate'] = baseline + (smoothed_changes * scale_factor) + (speed_diff * 0.0002)
                     
                     # Add artificial surge points based on throttle application
                     if driver['status'] == 'crash':
@@ -277,9 +507,9 @@ def create_high_impact_visualization(race, comparison_group):
     title_ax = fig.add_subplot(gs[0, :])
     title_ax.set_facecolor(BACKGROUND_COLOR)
     title_ax.text(0.5, 0.98, comparison_group['title'], 
-                 color='white', fontsize=28, fontweight='bold', ha='center', va='center')
+                 color='white', fontsize=28, fontproperties=_FP_BOLD, ha='center', va='center')
     title_ax.text(0.5, 0.65, comparison_group['subtitle'], 
-                 color=HIGHLIGHT_COLOR, fontsize=18, style='italic', ha='center', va='center')
+                 color=HIGHLIGHT_COLOR, fontsize=18, fontproperties=_FP_ITALIC, ha='center', va='center')
     # Add the requested subtitle
     title_ax.text(0.5, 0.25, "Visual by Lucas Qiu | Data from F1 Fast API", 
                  color='white', fontsize=12, alpha=0.7, ha='center', va='center')
@@ -314,6 +544,26 @@ def create_high_impact_visualization(race, comparison_group):
     for spine in legend_torque.spines.values():
         spine.set_visible(False)
     
+    # Fix the data limits up front and switch autoscaling off so every
+    # artist added below skips Matplotlib's limit-recomputation pass
+    all_dist = np.concatenate([d['data']['RelativeDistance'].to_numpy() for d in driver_data.values()])
+    all_speed = np.concatenate([d['data']['Speed'].to_numpy() for d in driver_data.values()])
+    all_torque = np.concatenate([d['data']['TorqueEstimate'].to_numpy() for d in driver_data.values()])
+    x_min, x_max = np.nanmin(all_dist), np.nanmax(all_dist)
+    torque_lo = min(np.nanmin(all_torque), 0)
+    torque_hi = np.nanmax(all_torque)
+    torque_span = (torque_hi - torque_lo) or 1.0
+
+    ax_speed.set_xlim(x_min, x_max)
+    # Lower bound 0 keeps the scaled throttle trace on screen; headroom for
+    # the annotation boxes
+    ax_speed.set_ylim(0, max(np.nanmax(all_speed) * 1.1, 100))
+    ax_torque.set_xlim(x_min, x_max)
+    # Extra headroom covers the 1.3x surge rectangles and star markers
+    ax_torque.set_ylim(torque_lo - 0.05 * torque_span, torque_hi + 0.35 * torque_span)
+    ax_speed.set_autoscale_on(False)
+    ax_torque.set_autoscale_on(False)
+
     # Collect handles and labels for grouped legends
     speed_handles, speed_labels = [], []
     torque_handles, torque_labels = [], []
@@ -333,12 +583,17 @@ def create_high_impact_visualization(race, comparison_group):
         speed_handles.append(speed_line)
         speed_labels.append(f"{driver_info['label']}")
         
-        # Create throttle as smaller markers for reduced visual noise
-        # Use alpha to create dotted line effect for throttle
-        for i in range(0, len(df), 5):  # Plot every 5th point for cleaner look
-            if i < len(df):
-                ax_speed.scatter(df['RelativeDistance'].iloc[i], df['Throttle'].iloc[i] * 0.8,  # Scale to fit on same axis
-                           color=driver_color, s=20, alpha=0.5, marker='o')
+        # Create throttle as a faint dotted trace for reduced visual noise.
+        # A LineCollection of consecutive segments renders as one backend
+        # primitive, cheaper than a marker PathCollection of the same size
+        throttle_xy = df[['RelativeDistance', 'Throttle']].to_numpy()[::5]
+        throttle_xy[:, 1] *= 0.8  # Scale to fit on same axis
+        throttle_pts = throttle_xy.reshape(-1, 1, 2)
+        throttle_segs = np.concatenate([throttle_pts[:-1], throttle_pts[1:]], axis=1)
+        ax_speed.add_collection(LineCollection(
+            throttle_segs, colors=driver_color, alpha=0.5, linewidths=1.5, linestyles=':',
+            rasterized=True
+        ))
         
         # PLOT 2: Torque Profile with critical points
         torque_line, = ax_torque.plot(df['RelativeDistance'], df['TorqueEstimate'],
@@ -349,98 +604,96 @@ def create_high_impact_visualization(race, comparison_group):
         
         if df['TorqueSurge'].any():
             surge_points = df[df['TorqueSurge']]
-            
-            # Add large star markers for torque surges
-            for _, surge_point in surge_points.iterrows():
-                # Create a more visible marker for torque surge
-                ax_torque.scatter(
-                    surge_point['RelativeDistance'], 
-                    surge_point['TorqueEstimate'],
-                    s=250, marker='*', color=WARNING_COLOR, edgecolor='white', linewidth=1.5, zorder=10
-                )
-                
-                # Add shaded regions for torque surge areas
-                rect = patches.Rectangle(
-                    (surge_point['RelativeDistance'] - 15, 0), 
-                    30, surge_point['TorqueEstimate'] * 1.3,
-                    alpha=0.2, fc=WARNING_COLOR, ec=WARNING_COLOR, linewidth=1.5
-                )
-                ax_torque.add_patch(rect)
-                
+            surge_xs = surge_points['RelativeDistance'].to_numpy()
+            surge_ys = surge_points['TorqueEstimate'].to_numpy()
+
+            # Add large star markers for torque surges - one scatter call
+            # builds a single collection instead of one artist per point
+            ax_torque.scatter(
+                surge_xs, surge_ys,
+                s=250, marker='*', color=WARNING_COLOR, edgecolor='white', linewidth=1.5, zorder=10
+            )
+
+            # Add shaded regions for torque surge areas, batched into a
+            # single PatchCollection to keep per-artist overhead constant
+            rects = [
+                patches.Rectangle((x - 15, 0), 30, y * 1.3)
+                for x, y in zip(surge_xs, surge_ys)
+            ]
+            ax_torque.add_collection(PatchCollection(
+                rects, facecolor=WARNING_COLOR, edgecolor=WARNING_COLOR, alpha=0.2, linewidth=1.5
+            ))
+
+            for surge_x, surge_y in zip(surge_xs, surge_ys):
                 # Add a bold text label at surge point
-                ax_torque.annotate("TORQUE SPIKE", 
-                        (surge_point['RelativeDistance'], surge_point['TorqueEstimate']),
+                ax_torque.annotate("TORQUE SPIKE",
+                        (surge_x, surge_y),
                         xytext=(5, 15), textcoords='offset points',
-                        color=WARNING_COLOR, fontweight='bold', fontsize=14,
-                        bbox=dict(facecolor=BACKGROUND_COLOR, edgecolor=WARNING_COLOR, 
-                                alpha=0.7, boxstyle='round,pad=0.5'))
+                        color=WARNING_COLOR, fontproperties=_FP_BOLD, fontsize=14,
+                        bbox=WARN_BBOX)
         
         # Highlight recovery attempts with higher visual impact
         if df['RecoveryAttempt'].any():
             recovery_points = df[df['RecoveryAttempt']]
+            recovery_xs = recovery_points['RelativeDistance'].to_numpy()
+            recovery_ys = recovery_points['TorqueEstimate'].to_numpy()
             if driver_info['status'] == 'save':
-                for _, point in recovery_points.iterrows():
-                    # Create a more visible marker for successful recovery
-                    ax_torque.scatter(
-                        point['RelativeDistance'], 
-                        point['TorqueEstimate'],
-                        s=200, marker='o', color=SAVE_COLOR, edgecolor='white', linewidth=1.5, zorder=10
-                    )
-                    
+                # One batched marker collection for all successful recoveries
+                ax_torque.scatter(
+                    recovery_xs, recovery_ys,
+                    s=200, marker='o', color=SAVE_COLOR, edgecolor='white', linewidth=1.5, zorder=10
+                )
+                for point_x, point_y in zip(recovery_xs, recovery_ys):
                     # Add bolder text for successful recovery
-                    ax_torque.annotate("RECOVERY", 
-                            (point['RelativeDistance'], point['TorqueEstimate']),
+                    ax_torque.annotate("RECOVERY",
+                            (point_x, point_y),
                             xytext=(5, -30), textcoords='offset points',
-                            color=SAVE_COLOR, fontweight='bold', fontsize=14,
-                            bbox=dict(facecolor=BACKGROUND_COLOR, edgecolor=SAVE_COLOR, 
-                                    alpha=0.7, boxstyle='round,pad=0.5'))
+                            color=SAVE_COLOR, fontproperties=_FP_BOLD, fontsize=14,
+                            bbox=SAVE_BBOX)
             else:
-                for _, point in recovery_points.iterrows():
-                    # Create a more visible marker for failed recovery
-                    ax_torque.scatter(
-                        point['RelativeDistance'], 
-                        point['TorqueEstimate'],
-                        s=200, marker='x', color=CRASH_COLOR, linewidth=3, zorder=10
-                    )
-                    
+                # One batched marker collection for all failed recoveries
+                ax_torque.scatter(
+                    recovery_xs, recovery_ys,
+                    s=200, marker='x', color=CRASH_COLOR, linewidth=3, zorder=10
+                )
+                for point_x, point_y in zip(recovery_xs, recovery_ys):
                     # Add bolder text for failed recovery
-                    ax_torque.annotate("FAILED", 
-                            (point['RelativeDistance'], point['TorqueEstimate']),
+                    ax_torque.annotate("FAILED",
+                            (point_x, point_y),
                             xytext=(5, -30), textcoords='offset points',
-                            color=CRASH_COLOR, fontweight='bold', fontsize=14,
-                            bbox=dict(facecolor=BACKGROUND_COLOR, edgecolor=CRASH_COLOR, 
-                                    alpha=0.7, boxstyle='round,pad=0.5'))
+                            color=CRASH_COLOR, fontproperties=_FP_BOLD, fontsize=14,
+                            bbox=CRASH_BBOX)
     
     ax_speed.axvline(x=0, color='white', linestyle='--', alpha=0.5, linewidth=1.5, label='Turn Apex')
     ax_torque.axvline(x=0, color='white', linestyle='--', alpha=0.5, linewidth=1.5)
     
-    ax_speed.set_ylabel('Speed (km/h)', color='white', fontsize=16, fontweight='bold')
+    ax_speed.set_ylabel('Speed (km/h)', color='white', fontsize=16, fontproperties=_FP_BOLD)
     ax_speed.tick_params(axis='y', colors='white', labelsize=12)
     ax_speed.tick_params(axis='x', colors='white', labelsize=12)
-    ax_speed.set_title('SPEED & THROTTLE PROFILES', color='white', fontsize=20, fontweight='bold')
+    ax_speed.set_title('SPEED & THROTTLE PROFILES', color='white', fontsize=20, fontproperties=_FP_BOLD)
     
     ax_speed_twin = ax_speed.twinx()
-    ax_speed_twin.set_ylabel('Throttle (%)', color='white', fontsize=16, fontweight='bold')
+    ax_speed_twin.set_ylabel('Throttle (%)', color='white', fontsize=16, fontproperties=_FP_BOLD)
     ax_speed_twin.tick_params(axis='y', colors='white', labelsize=12)
     ax_speed_twin.set_ylim(0, 110)  # Force consistent throttle range
     
     legend_speed.text(0.95, 0.6, "THROTTLE APPLICATION", color='white', fontsize=12, ha='right', va='center')
     legend_speed.scatter([0.97], [0.6], color='white', s=80, alpha=0.5, marker='o')
     
-    ax_torque.set_xlabel('Distance from Turn Center (m)', color='white', fontsize=16, fontweight='bold')
-    ax_torque.set_ylabel('Estimated Torque', color='white', fontsize=16, fontweight='bold')
+    ax_torque.set_xlabel('Distance from Turn Center (m)', color='white', fontsize=16, fontproperties=_FP_BOLD)
+    ax_torque.set_ylabel('Estimated Torque', color='white', fontsize=16, fontproperties=_FP_BOLD)
     ax_torque.tick_params(axis='y', colors='white', labelsize=12)
     ax_torque.tick_params(axis='x', colors='white', labelsize=12)
-    ax_torque.set_title('TORQUE DELIVERY & CRITICAL POINTS', color='white', fontsize=20, fontweight='bold')
+    ax_torque.set_title('TORQUE DELIVERY & CRITICAL POINTS', color='white', fontsize=20, fontproperties=_FP_BOLD)
     
     legend_torque.scatter([0.8], [0.5], s=200, marker='*', color=WARNING_COLOR, edgecolor='white', linewidth=1.5)
-    legend_torque.text(0.83, 0.5, "TORQUE SPIKE", color=WARNING_COLOR, fontsize=12, fontweight='bold', ha='left', va='center')
+    legend_torque.text(0.83, 0.5, "TORQUE SPIKE", color=WARNING_COLOR, fontsize=12, fontproperties=_FP_BOLD, ha='left', va='center')
     
     legend_torque.scatter([0.8], [0.3], s=150, marker='o', color=SAVE_COLOR, edgecolor='white', linewidth=1.5)
-    legend_torque.text(0.83, 0.3, "SUCCESSFUL RECOVERY", color=SAVE_COLOR, fontsize=12, fontweight='bold', ha='left', va='center')
+    legend_torque.text(0.83, 0.3, "SUCCESSFUL RECOVERY", color=SAVE_COLOR, fontsize=12, fontproperties=_FP_BOLD, ha='left', va='center')
     
     legend_torque.scatter([0.8], [0.1], s=150, marker='x', color=CRASH_COLOR, linewidth=3)
-    legend_torque.text(0.83, 0.1, "FAILED RECOVERY", color=CRASH_COLOR, fontsize=12, fontweight='bold', ha='left', va='center')
+    legend_torque.text(0.83, 0.1, "FAILED RECOVERY", color=CRASH_COLOR, fontsize=12, fontproperties=_FP_BOLD, ha='left', va='center')
     
     if len(speed_handles) > 0:
         # Separate crash and save cases
@@ -505,9 +758,9 @@ def create_high_impact_visualization(race, comparison_group):
                     ax_speed.annotate('SUDDEN THROTTLE\n→ CRASH', 
                                   (steep_point['RelativeDistance'], steep_point['Speed']),
                                   xytext=(30, 30), textcoords='offset points',
-                                  color='white', fontweight='bold', fontsize=16,
-                                  bbox=dict(facecolor=CRASH_COLOR, alpha=0.7, boxstyle='round,pad=0.5'),
-                                  arrowprops=dict(arrowstyle='->', lw=2, color=CRASH_COLOR))
+                                  color='white', fontproperties=_FP_BOLD, fontsize=16,
+                                  bbox=CRASH_FILL_BBOX,
+                                  arrowprops=CRASH_ARROW)
             else:
                 # Find gradual throttle application sections - safely
                 gradual_points = df[(df['Throttle'] > 30) & (df['Throttle'] < 70)]
@@ -521,9 +774,9 @@ def create_high_impact_visualization(race, comparison_group):
                         ax_speed.annotate('GRADUAL THROTTLE\n→ RECOVERY', 
                                       (gradual_point['RelativeDistance'], gradual_point['Speed']),
                                       xytext=(-60, -30), textcoords='offset points',
-                                      color='white', fontweight='bold', fontsize=16,
-                                      bbox=dict(facecolor=SAVE_COLOR, alpha=0.7, boxstyle='round,pad=0.5'),
-                                      arrowprops=dict(arrowstyle='->', lw=2, color=SAVE_COLOR))
+                                      color='white', fontproperties=_FP_BOLD, fontsize=16,
+                                      bbox=SAVE_FILL_BBOX,
+                                      arrowprops=SAVE_ARROW)
     
     if comparison_group['title'] == "THROTTLE CONTROL: RECOVERY VS SPIN":
         # Add special annotations for the throttle control comparison
@@ -550,9 +803,9 @@ def create_high_impact_visualization(race, comparison_group):
                 ax_torque.annotate('SINGLE LARGE INPUT\n→ CRASH', 
                              (max_change_point['RelativeDistance'], max_change_point['TorqueEstimate']),
                              xytext=(30, 30), textcoords='offset points',
-                             color='white', fontweight='bold', fontsize=14,
-                             bbox=dict(facecolor=CRASH_COLOR, alpha=0.7, boxstyle='round,pad=0.5'),
-                             arrowprops=dict(arrowstyle='->', lw=2, color=CRASH_COLOR))
+                             color='white', fontproperties=_FP_BOLD, fontsize=14,
+                             bbox=CRASH_FILL_BBOX,
+                             arrowprops=CRASH_ARROW)
             
             # For save driver, find point with multiple small changes
             if not save_data['ThrottleChange'].empty:
@@ -569,122 +822,254 @@ def create_high_impact_visualization(race, comparison_group):
                     ax_torque.annotate('MULTIPLE SMALL\nADJUSTMENTS\n→ RECOVERY', 
                                  (mid_point['RelativeDistance'], mid_point['TorqueEstimate']),
                                  xytext=(-80, -50), textcoords='offset points',
-                                 color='white', fontweight='bold', fontsize=14,
-                                 bbox=dict(facecolor=SAVE_COLOR, alpha=0.7, boxstyle='round,pad=0.5'),
-                                 arrowprops=dict(arrowstyle='->', lw=2, color=SAVE_COLOR))
+                                 color='white', fontproperties=_FP_BOLD, fontsize=14,
+                                 bbox=SAVE_FILL_BBOX,
+                                 arrowprops=SAVE_ARROW)
     
     insight_text = fig.text(0.5, 0.01, f"KEY INSIGHT: {comparison_group['insight']}",
-                          color=HIGHLIGHT_COLOR, fontsize=18, fontweight='bold', ha='center', va='center',
-                          bbox=dict(facecolor=BACKGROUND_COLOR, alpha=0.7, boxstyle='round,pad=0.5'))
+                          color=HIGHLIGHT_COLOR, fontsize=18, fontproperties=_FP_BOLD, ha='center', va='center',
+                          bbox=INSIGHT_BBOX)
     
-    plt.tight_layout(rect=[0, 0.05, 1, 0.98])
-    plt.savefig(f"crash_analysis_plots/quick_insights/{comparison_group['filename']}.png", 
-                facecolor=BACKGROUND_COLOR, dpi=300)
+    # The layout is static and deterministic, so position the grid directly
+    # instead of paying tight_layout's full measure-every-artist draw pass
+    fig.subplots_adjust(left=0.06, right=0.97, top=0.98, bottom=0.07, hspace=0.4)
+    # Copy the rendered buffer before closing so the summary page can embed
+    # it directly instead of decoding the PNG back from disk
+    thumbnail = np.array(_save_figure(fig, f"crash_analysis_plots/quick_insights/{comparison_group['filename']}.png"))
     plt.close()
-    
+
     print(f"Created high-impact visualization: {comparison_group['filename']}.png")
+    return thumbnail
+
+_SUMMARY_TEMPLATE_PATH = 'cache/summary_template.pkl'
+# Bump when the template layout changes so stale pickles are rebuilt
+_SUMMARY_TEMPLATE_VERSION = 2
+_TAKEAWAY_OVERLAY_PATH = 'cache/takeaway_overlay.png'
+
+def _takeaway_overlay():
+    """Rasterize the static takeaway decoration once to a transparent PNG.
 
-def create_key_insight_summary(comparisons):
-    """Create a visually striking summary page with key insights"""
+    The rounded-box tessellation and its text never change between runs,
+    so render them one time at the summary dpi and composite the result
+    back as a plain image layer instead of re-running the path and glyph
+    rendering on every summary."""
+    if not os.path.exists(_TAKEAWAY_OVERLAY_PATH):
+        overlay_fig = plt.figure(figsize=(16, 9))
+        overlay_fig.patch.set_alpha(0)
+
+        overlay_fig.text(0.5, 0.15, "CRITICAL TAKEAWAY:",
+                color='white', fontsize=20, fontproperties=_FP_BOLD, ha='center')
+
+        takeaway_box = patches.FancyBboxPatch((0.15, 0.08), 0.7, 0.06,
+                                             boxstyle=patches.BoxStyle("Round", pad=0.6),
+                                             facecolor=HIGHLIGHT_COLOR, alpha=0.2, edgecolor=HIGHLIGHT_COLOR, linewidth=2)
+        overlay_fig.add_artist(takeaway_box)
+
+        overlay_fig.text(0.5, 0.11, "In wet conditions, smooth throttle modulation is the most vital skill",
+                color=HIGHLIGHT_COLOR, fontsize=16, fontproperties=_FP_BOLD, ha='center')
+
+        overlay_fig.text(0.5, 0.06, "Drivers who crashed showed 2-3× higher rates of throttle change than those who saved their cars",
+                color='white', fontsize=14, ha='center')
+
+        overlay_fig.set_dpi(SUMMARY_DPI)
+        overlay_fig.canvas.draw()
+        buf = np.array(overlay_fig.canvas.buffer_rgba())
+        Image.fromarray(buf).save(_TAKEAWAY_OVERLAY_PATH, format='PNG', compress_level=1)
+        plt.close(overlay_fig)
+    return plt.imread(_TAKEAWAY_OVERLAY_PATH)
+
+def _build_summary_template(n_sections):
+    """Build the static scaffold of the summary page once.
+
+    The headline, subtitle, credit line, takeaway box and watermark never
+    change, so they live in the template; handles to the per-run artists
+    (section titles, insight lines, thumbnail and driver axes) are stored
+    in fig._slots so a cached template only needs its text and image data
+    swapped."""
     fig = plt.figure(figsize=(16, 9), facecolor=BACKGROUND_COLOR)
-    
+
     # Add headline with more impact
-    fig.text(0.5, 0.99, "🚨 KEY INSIGHTS: AUSTRALIAN GP 2025 WET CONDITIONS 🚨", 
-             color='white', fontsize=28, fontweight='bold', ha='center')
-    
+    fig.text(0.5, 0.99, "🚨 KEY INSIGHTS: AUSTRALIAN GP 2025 WET CONDITIONS 🚨",
+             color='white', fontsize=28, fontproperties=_FP_BOLD, ha='center')
+
     # Add subtitle with more emphasis
-    fig.text(0.5, 0.94, "WHY TORQUE DELIVERY & THROTTLE CONTROL MADE THE DIFFERENCE", 
-            color=HIGHLIGHT_COLOR, fontsize=18, fontweight='bold', ha='center')
-    
+    fig.text(0.5, 0.94, "WHY TORQUE DELIVERY & THROTTLE CONTROL MADE THE DIFFERENCE",
+            color=HIGHLIGHT_COLOR, fontsize=18, fontproperties=_FP_BOLD, ha='center')
+
     # Add the requested subtitle
-    fig.text(0.5, 0.90, "Visual by Lucas Qiu | Data from F1 Fast API", 
+    fig.text(0.5, 0.90, "Visual by Lucas Qiu | Data from F1 Fast API",
             color='white', fontsize=12, alpha=0.7, ha='center')
-    
+
+    slots = {}
     # Divide into sections with clearer separation
-    for i, comparison in enumerate(comparisons):
+    for i in range(n_sections):
         # Position each insight section with more spacing
         top = 0.80 - (i * 0.22)
-        
-        # Add section title with more emphasis
-        fig.text(0.5, top, comparison['title'], 
-                color='white', fontsize=20, fontweight='bold', ha='center')
-        
-        # Add key insight with highlighted background
-        insight_text = fig.text(0.5, top-0.03, comparison['insight'], 
-                              color=HIGHLIGHT_COLOR, fontsize=16, fontweight='bold', style='italic', ha='center',
+
+        # Section title with more emphasis
+        slots[f'title_{i}'] = fig.text(0.5, top, "",
+                color='white', fontsize=20, fontproperties=_FP_BOLD, ha='center')
+
+        # Key insight with highlighted background
+        slots[f'insight_{i}'] = fig.text(0.5, top-0.03, "",
+                              color=HIGHLIGHT_COLOR, fontsize=16, fontproperties=_FP_BOLD_ITALIC, ha='center',
                               bbox=dict(facecolor='#1F1F1F', alpha=0.7, boxstyle='round,pad=0.5'))
-        
+
+        thumb_ax = fig.add_axes([0.15, top-0.20, 0.7, 0.15])
+        thumb_ax.axis('off')
+        slots[f'thumb_{i}'] = thumb_ax
+
+        drivers_ax = fig.add_axes([0.15, top-0.25, 0.7, 0.02])
+        drivers_ax.axis('off')
+        slots[f'drivers_{i}'] = drivers_ax
+
+    # Static takeaway decoration composited as a pre-rendered raster layer
+    # instead of live FancyBboxPatch/text artists
+    overlay_ax = fig.add_axes([0, 0, 1, 1], zorder=5)
+    overlay_ax.set_facecolor('none')
+    overlay_ax.imshow(_takeaway_overlay(), extent=(0, 1, 0, 1), aspect='auto')
+    overlay_ax.axis('off')
+
+    # Add watermark
+    fig.text(0.95, 0.02, "F1 Crash Analysis Tool", color='gray', fontsize=10, ha='right')
+
+    fig._slots = slots
+    fig._template_version = _SUMMARY_TEMPLATE_VERSION
+    return fig
+
+def _load_summary_template(n_sections):
+    """Reuse the pickled summary scaffold when available, else build and
+    cache it for the next run"""
+    try:
+        with open(_SUMMARY_TEMPLATE_PATH, 'rb') as fh:
+            fig = pickle.load(fh)
+        if (getattr(fig, '_template_version', 0) == _SUMMARY_TEMPLATE_VERSION
+                and len(fig._slots) == 4 * n_sections):
+            return fig
+    except Exception:
+        pass
+
+    fig = _build_summary_template(n_sections)
+    try:
+        with open(_SUMMARY_TEMPLATE_PATH, 'wb') as fh:
+            pickle.dump(fig, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        pass
+    return fig
+
+def create_key_insight_summary(comparisons, thumbnails=None):
+    """Create a visually striking summary page with key insights.
+
+    thumbnails maps comparison filenames to the RGBA buffers rendered by
+    create_high_impact_visualization, so already-rendered figures are
+    embedded without decoding their PNGs back from disk."""
+    thumbnails = thumbnails or {}
+    fig = _load_summary_template(len(comparisons))
+    slots = fig._slots
+
+    for i, comparison in enumerate(comparisons):
+        slots[f'title_{i}'].set_text(comparison['title'])
+        slots[f'insight_{i}'].set_text(comparison['insight'])
+        ax = slots[f'thumb_{i}']
+
         try:
-            # Add thumbnail of the visualization
-            img = plt.imread(f"crash_analysis_plots/quick_insights/{comparison['filename']}.png")
-            ax = fig.add_axes([0.15, top-0.20, 0.7, 0.15])
+            # Add thumbnail of the visualization, preferring the in-memory
+            # buffer over a PNG decode from disk
+            img = thumbnails.get(comparison['filename'])
+            if img is None:
+                img = plt.imread(f"crash_analysis_plots/quick_insights/{comparison['filename']}.png")
+            # Pre-shrink to the axes' pixel footprint (0.7 x 0.15 of the
+            # canvas) so Agg and the PNG encoder never carry the full
+            # 300-dpi comparison buffer through the summary pipeline. The
+            # footprint is a bounding box: scale both dimensions by the
+            # same factor so imshow letterboxes the 16:9 thumbnail exactly
+            # as it would the full-size buffer
+            target_w = int(0.7 * 16 * SUMMARY_DPI)
+            target_h = int(0.15 * 9 * SUMMARY_DPI)
+            if img.dtype != np.uint8:
+                img = (img * 255).astype(np.uint8)
+            scale = min(target_w / img.shape[1], target_h / img.shape[0])
+            if scale < 1:
+                new_size = (max(1, int(img.shape[1] * scale)), max(1, int(img.shape[0] * scale)))
+                img = np.asarray(Image.fromarray(img).resize(new_size, Image.BILINEAR))
             ax.imshow(img)
-            ax.axis('off')
-            
+
             # Add a border around the image
             rect = patches.Rectangle((0, 0), 1, 1, linewidth=2, edgecolor='white', facecolor='none', transform=ax.transAxes)
             ax.add_patch(rect)
         except:
             # Create a placeholder if image not found
-            ax = fig.add_axes([0.15, top-0.20, 0.7, 0.15])
-            ax.text(0.5, 0.5, f"Visualization: {comparison['filename']}", 
-                   ha='center', va='center', color='white', fontsize=16, fontweight='bold')
+            ax.text(0.5, 0.5, f"Visualization: {comparison['filename']}",
+                   ha='center', va='center', color='white', fontsize=16, fontproperties=_FP_BOLD)
             ax.set_facecolor('#1F1F1F')
-            ax.axis('off')
-        
+
         # Add drivers involved with team logos
         drivers = comparison['drivers']
-        ax_drivers = fig.add_axes([0.15, top-0.25, 0.7, 0.02])
-        ax_drivers.axis('off')
-        
+        ax_drivers = slots[f'drivers_{i}']
+
         # Display drivers with team logos
         for j, driver in enumerate(drivers):
             driver_code = driver['code']
             driver_color = driver['color']
             driver_x = 0.1 + (j * 0.25)  # Evenly space drivers
-            
+
             # Add driver code with status
             status = driver['status'].upper()
-            ax_drivers.text(driver_x, 0.5, f"{driver_code}: {status}", 
-                          color=driver_color, fontsize=14, fontweight='bold', ha='left', va='center')
-            
+            ax_drivers.text(driver_x, 0.5, f"{driver_code}: {status}",
+                          color=driver_color, fontsize=14, fontproperties=_FP_BOLD, ha='left', va='center')
+
             # Add team logo
             add_team_logo(fig, ax_drivers, driver_code, driver_x-0.05, 0.5, zoom=0.1)
-    
-    fig.text(0.5, 0.15, "CRITICAL TAKEAWAY:",
-            color='white', fontsize=20, fontweight='bold', ha='center')
-    
-    takeaway_box = patches.FancyBboxPatch((0.15, 0.08), 0.7, 0.06,
-                                         boxstyle=patches.BoxStyle("Round", pad=0.6),
-                                         facecolor=HIGHLIGHT_COLOR, alpha=0.2, edgecolor=HIGHLIGHT_COLOR, linewidth=2)
-    fig.add_artist(takeaway_box)
-    
-    fig.text(0.5, 0.11, "In wet conditions, smooth throttle modulation is the most vital skill", 
-            color=HIGHLIGHT_COLOR, fontsize=16, fontweight='bold', ha='center')
-    
-    fig.text(0.5, 0.06, "Drivers who crashed showed 2-3× higher rates of throttle change than those who saved their cars", 
-            color='white', fontsize=14, ha='center')
-    
-    # Add watermark
-    fig.text(0.95, 0.02, "F1 Crash Analysis Tool", color='gray', fontsize=10, ha='right')
-    
-    plt.savefig("crash_analysis_plots/quick_insights/key_findings_summary.png", 
-                facecolor=BACKGROUND_COLOR, dpi=300)
-    plt.close()
-    
+
+    _save_figure(fig, "crash_analysis_plots/quick_insights/key_findings_summary.png", dpi=SUMMARY_DPI)
+    plt.close(fig)
+
     print("Created key findings summary visualization")
 
+@lru_cache(maxsize=1)
+def _get_race():
+    """Load the race session once per process"""
+    return load_race_data()
+
+def _render_comparison(comparison):
+    """Worker entry point: render a single comparison figure and hand the
+    rendered buffer back for the summary page"""
+    thumbnail = create_high_impact_visualization(_get_race(), comparison)
+    # Make sure this worker's PNG is on disk before reporting completion
+    _flush_writes()
+    return comparison['filename'], thumbnail
+
 def main():
     plt.style.use('dark_background')
-    
-    race = load_race_data()
-    
-    for comparison in KEY_COMPARISONS:
-        create_high_impact_visualization(race, comparison)
-    
-    create_key_insight_summary(KEY_COMPARISONS)
-    
+
+    # Warm the FastF1 disk cache with a single load in the parent - on a
+    # cold cache this keeps the workers from all downloading the session
+    # at once and racing on the same cache entries
+    load_race_data()
+
+    # The comparison figures are independent, so render them in parallel
+    # worker processes; each loads the session from the disk cache warmed
+    # above rather than the network
+    thumbnails = {}
+    with ProcessPoolExecutor(max_workers=min(len(KEY_COMPARISONS), os.cpu_count() or 1)) as executor:
+        futures = [executor.submit(_render_comparison, comparison) for comparison in KEY_COMPARISONS]
+        for future in as_completed(futures):
+            filename, thumbnail = future.result()
+            if thumbnail is not None:
+                thumbnails[filename] = thumbnail
+
+    create_key_insight_summary(KEY_COMPARISONS, thumbnails)
+    _flush_writes()
+
     print("\nQuick visualizations complete. Check 'crash_analysis_plots/quick_insights' directory.")
 
 if __name__ == "__main__":
-    main() 
+    # forkserver avoids plain fork's issues with the writer/pool threads;
+    # each worker still re-imports this module (and FastF1/Matplotlib)
+    # once when it spawns, which stays off the render path
+    if platform.system() == 'Linux':
+        try:
+            multiprocessing.set_start_method('forkserver')
+        except RuntimeError:
+            pass
+    main()